@@ -0,0 +1,18 @@
+from django.db.models.functions import Now as BaseNow
+
+
+class Now(BaseNow):
+    """
+    Database current timestamp with sub-second precision.
+
+    SQLite's CURRENT_TIMESTAMP stops at whole seconds and STRFTIME's %f at
+    milliseconds, while Django stores microseconds as text. Padding with
+    '999' puts now at the end of the current millisecond, so rows stamped
+    within it still compare as <= now.
+    """
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template="STRFTIME('%%%%Y-%%%%m-%%%%d %%%%H:%%%%M:%%%%f', 'NOW') || '999'",
+            **extra_context
+        )
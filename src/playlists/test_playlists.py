@@ -57,7 +57,7 @@ class PlaylistModelTestCase(TestCase):
 
     def test_video_playlist_ids_propery(self):
         ids = self.obj_a.video.get_playlist_ids()
-        acutal_ids = list(Playlist.objects.filter(video=self.video_a).values_list('id', flat=True))
+        acutal_ids = tuple(Playlist.objects.filter(video=self.video_a).values_list('id', flat=True))
         self.assertEqual(ids, acutal_ids)
 
     def test_video_playlist(self):
@@ -96,4 +96,17 @@ class PlaylistModelTestCase(TestCase):
         published_qs_2 = Playlist.objects.published()
         self.assertTrue(published_qs.exists())
         self.assertEqual(published_qs.count(), published_qs_2.count())
-        
\ No newline at end of file
+
+
+class VideoPlaylistIdsTestCase(TestCase):
+    def setUp(self):
+        self.video = Video.objects.create(title='Featured video', video_id='featured')
+        Playlist.objects.create(title='Playlist A', video=self.video)
+        Playlist.objects.create(title='Playlist B', video=self.video)
+
+    def test_video_playlist_ids_prefetched(self):
+        video = Video.objects.prefetch_related('playlist_featured').get(id=self.video.id)
+        actual_ids = list(Playlist.objects.filter(video=self.video).values_list('id', flat=True))
+        with self.assertNumQueries(0):
+            ids = video.get_playlist_ids()
+        self.assertEqual(sorted(ids), sorted(actual_ids))
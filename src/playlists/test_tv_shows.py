@@ -62,7 +62,7 @@ class TVShowProxyModelTestCase(TestCase):
 
     def test_video_playlist_ids_propery(self):
         ids = self.obj_a.video.get_playlist_ids()
-        acutal_ids = list(TVShowProxy.objects.all().filter(video=self.video_a).values_list('id', flat=True))
+        acutal_ids = tuple(TVShowProxy.objects.all().filter(video=self.video_a).values_list('id', flat=True))
         self.assertEqual(ids, acutal_ids)
 
     def test_video_playlist(self):
@@ -1,10 +1,79 @@
-from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import BooleanField, Case, Prefetch, Value, When
+from django.utils.html import format_html, format_html_join
+from djangoflix.db.functions import Now
+from djangoflix.db.models import PublishStateOptions
+from playlists.models import Playlist
 from .models import VideoAllProxy, VideoPublishedProxy
 
 
+# Columns each changelist renders or orders by; skips description/slug etc.
+VIDEO_ALL_LIST_FIELDS = ('id', 'title', 'video_id', 'state', 'created')
+VIDEO_PUBLISHED_LIST_FIELDS = ('id', 'title', 'video_id', 'publish_timestamp')
+
+# Largest BigAutoField value; bigger ints overflow the database driver.
+MAX_PK = 2 ** 63 - 1
+
+# Keeps each UPDATE ... WHERE id IN (...) well under backend parameter limits.
+UNPUBLISH_BATCH_SIZE = 10000
+
+
+def _playlist_featured_prefetch():
+    """Prefetch featured playlist ids in one query for the whole page."""
+    return Prefetch(
+        'playlist_featured',
+        queryset=Playlist.objects.only('id', 'video')
+    )
+
+
+def _parse_playlist_id(search_term):
+    """Return search_term as a valid playlist pk, or None."""
+    search_term = search_term.strip()
+    # isascii() rejects digits like '²' that isdigit() accepts but int() does not.
+    if not search_term.isascii():
+        return None
+    try:
+        value = int(search_term)
+    except ValueError:
+        return None
+    if 0 < value <= MAX_PK:
+        return value
+    return None
+
+
+class PlaylistIdSearchMixin:
+    """Also match videos featured in the playlist whose id is searched."""
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        playlist_id = _parse_playlist_id(search_term)
+        if playlist_id is not None:
+            featured = Playlist.objects.filter(id=playlist_id).values('video')
+            results |= queryset.filter(id__in=featured)
+        return results, may_have_duplicates
+
+
+class FullRowObjectMixin:
+    """Load the full row for change forms; changelists stay narrowed."""
+
+    def get_object(self, request, object_id, from_field=None):
+        queryset = self.get_queryset(request).defer(None)
+        model = queryset.model
+        field = model._meta.pk if from_field is None else model._meta.get_field(from_field)
+        try:
+            object_id = field.to_python(object_id)
+            return queryset.get(**{field.name: object_id})
+        except (model.DoesNotExist, ValidationError, ValueError):
+            return None
+
+
 @admin.register(VideoAllProxy)
-class VideoAllAdmin(admin.ModelAdmin):
+class VideoAllAdmin(FullRowObjectMixin, PlaylistIdSearchMixin, admin.ModelAdmin):
     """Admin interface for VideoAllProxy model with enhanced features."""
     list_display = [
         'title', 
@@ -13,21 +82,21 @@ class VideoAllAdmin(admin.ModelAdmin):
         'video_id', 
         'display_published_status',
         'get_playlist_ids',
-        'created_at'
+        'created'
     ]
-    search_fields = ['title', 'video_id', 'get_playlist_ids']
-    list_filter = ['state', 'active', 'created_at']
+    search_fields = ['title', 'video_id']
+    list_filter = ['state', 'active', 'created']
     readonly_fields = [
         'id', 
         'is_published', 
         'publish_timestamp', 
         'get_playlist_ids',
-        'created_at',
-        'updated_at'
+        'created',
+        'updated'
     ]
     list_per_page = 25
-    date_hierarchy = 'publish_timestamp'
-    ordering = ['-created_at']
+    list_select_related = True
+    ordering = ['-created']
     fieldsets = (
         (None, {
             'fields': ('title', 'description', 'state')
@@ -37,19 +106,37 @@ class VideoAllAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('Timestamps', {
-            'fields': ('created_at', 'updated_at', 'publish_timestamp'),
+            'fields': ('created', 'updated', 'publish_timestamp'),
             'classes': ('collapse',)
         }),
     )
 
+    def get_queryset(self, request):
+        """Load only listed columns and prefetch featured playlists."""
+        return super().get_queryset(request).only(
+            *VIDEO_ALL_LIST_FIELDS
+        ).prefetch_related(_playlist_featured_prefetch()).annotate(
+            _is_published=Case(
+                When(
+                    active=True,
+                    state=PublishStateOptions.PUBLISH,
+                    publish_timestamp__lte=Now(),
+                    then=Value(True)
+                ),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        )
+
     def display_id(self, obj):
         """Formatted display for ID field."""
         return f"VID-{obj.id:08d}"
     display_id.short_description = 'ID'
+    display_id.admin_order_field = 'id'
 
     def display_published_status(self, obj):
         """Color-coded published status."""
-        if obj.is_published:
+        if obj._is_published:
             return format_html(
                 '<span style="color: green; font-weight: bold;">Published</span>'
             )
@@ -57,10 +144,11 @@ class VideoAllAdmin(admin.ModelAdmin):
             '<span style="color: red; font-weight: bold;">Draft</span>'
         )
     display_published_status.short_description = 'Status'
+    display_published_status.admin_order_field = '_is_published'
 
 
 @admin.register(VideoPublishedProxy)
-class VideoPublishedProxyAdmin(admin.ModelAdmin):
+class VideoPublishedProxyAdmin(FullRowObjectMixin, PlaylistIdSearchMixin, admin.ModelAdmin):
     """Admin interface for published videos only."""
     list_display = [
         'title', 
@@ -68,32 +156,46 @@ class VideoPublishedProxyAdmin(admin.ModelAdmin):
         'publish_timestamp',
         'playlist_links'
     ]
-    search_fields = ['title', 'video_id', 'get_playlist_ids']
+    search_fields = ['title', 'video_id']
     list_per_page = 20
+    list_select_related = True
     date_hierarchy = 'publish_timestamp'
     ordering = ['-publish_timestamp']
     actions = ['unpublish_selected']
 
     def get_queryset(self, request):
-        """Return only active published videos."""
-        return super().get_queryset(request).filter(active=True)
+        """Return only published videos."""
+        return super().get_queryset(request).published().only(
+            *VIDEO_PUBLISHED_LIST_FIELDS
+        ).prefetch_related(_playlist_featured_prefetch())
 
     def playlist_links(self, obj):
         """Display playlist IDs as clickable links."""
         playlist_ids = obj.get_playlist_ids()
         if not playlist_ids:
             return "-"
-        
-        links = []
-        for pid in playlist_ids.split(','):
-            links.append(f'<a href="/admin/playlists/playlist/{pid}/">{pid}</a>')
-        return format_html(', '.join(links))
+        return format_html_join(
+            ', ',
+            '<a href="/admin/playlists/playlist/{0}/">{0}</a>',
+            ((pid,) for pid in playlist_ids)
+        )
     playlist_links.short_description = 'Playlists'
-    playlist_links.allow_tags = True
 
     def unpublish_selected(self, request, queryset):
         """Custom action to unpublish selected videos."""
-        updated = queryset.update(active=False)
+        selected = request.POST.getlist(helpers.ACTION_CHECKBOX_NAME)
+        select_across = request.POST.get('select_across') == '1'
+        if not select_across and len(selected) < UNPUBLISH_BATCH_SIZE:
+            updated = queryset.update(active=False)
+        else:
+            pks = list(queryset.values_list('pk', flat=True))
+            updated = 0
+            with transaction.atomic():
+                for start in range(0, len(pks), UNPUBLISH_BATCH_SIZE):
+                    batch = pks[start:start + UNPUBLISH_BATCH_SIZE]
+                    updated += self.model.objects.filter(
+                        pk__in=batch
+                    ).update(active=False)
         self.message_user(
             request,
             f'{updated} video(s) were successfully unpublished.',
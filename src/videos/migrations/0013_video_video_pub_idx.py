@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0012_alter_video_video_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['state', 'active', '-publish_timestamp'], include=('id', 'video_id', 'title'), name='video_pub_idx'),
+        ),
+    ]
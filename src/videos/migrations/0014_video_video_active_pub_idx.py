@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0013_video_video_pub_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(condition=models.Q(('active', True), ('state', 'PU')), fields=['publish_timestamp'], name='video_active_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+# Admin search runs icontains (ILIKE '%term%') on these columns; pg_trgm GIN
+# indexes make that indexable. Other backends have no equivalent.
+TRIGRAM_INDEXES = [
+    ('video_title_trgm', 'title'),
+    ('video_video_id_trgm', 'video_id'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('videos', 'Video')._meta.db_table
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s USING gin (%s gin_trgm_ops)' % (
+                schema_editor.quote_name(name),
+                schema_editor.quote_name(table),
+                schema_editor.quote_name(column),
+            )
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0014_video_video_active_pub_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
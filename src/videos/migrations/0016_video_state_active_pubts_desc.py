@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0015_video_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='video',
+            name='video_pub_idx',
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['state', 'active', '-publish_timestamp', '-id'], include=('video_id', 'title'), name='video_state_active_pubts_desc'),
+        ),
+    ]
@@ -1,37 +1,35 @@
 from django.db import models
+from django.db.models import Q
 from django.db.models.signals import pre_save
 from django.utils import timezone
 from django.utils.text import slugify
-from typing import Optional, List, TypeVar, Type
+from typing import Optional, Tuple, TypeVar, Type
 from django.core.exceptions import ValidationError
 
+from djangoflix.db.functions import Now
 from djangoflix.db.models import PublishStateOptions
 from djangoflix.db.receivers import publish_state_pre_save, slugify_pre_save
 
 # Type variable for queryset chaining
 _VideoQS = TypeVar('_VideoQS', bound='VideoQuerySet')
 
+# Bound once at import; read on every is_published/published() call
+_PUBLISH = PublishStateOptions.PUBLISH
+_now = timezone.now
+
 class VideoQuerySet(models.QuerySet):
     """Custom QuerySet for Video model with published content filtering."""
     
     def published(self: _VideoQS) -> _VideoQS:
         """Return only published videos that should be publicly visible."""
-        now = timezone.now()
         return self.filter(
-            state=PublishStateOptions.PUBLISH,
-            publish_timestamp__lte=now,
+            state=_PUBLISH,
+            publish_timestamp__lte=Now(),
             active=True
         )
 
-class VideoManager(models.Manager):
+class VideoManager(models.Manager.from_queryset(VideoQuerySet)):
     """Custom manager for Video model with published content access."""
-    
-    def get_queryset(self) -> VideoQuerySet:
-        return VideoQuerySet(self.model, using=self._db)
-
-    def published(self) -> VideoQuerySet:
-        """Return only published and active videos."""
-        return self.get_queryset().published()
 
 class Video(models.Model):
     """Main video content model with publishing workflow."""
@@ -86,7 +84,23 @@ class Video(models.Model):
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['video_id']),
-            models.Index(fields=['state', 'publish_timestamp']),
+            # Serves published() filtering and publish_timestamp DESC order.
+            # Keys descend like the published admin's ordering (with its -pk
+            # tiebreaker), so Postgres needs no Sort node for that list. The
+            # admin loads only id, title, video_id and publish_timestamp, all
+            # in the index, so Postgres can use an index-only scan there;
+            # plain published() callers load full rows and still hit the heap.
+            models.Index(
+                fields=['state', 'active', '-publish_timestamp', '-id'],
+                name='video_state_active_pubts_desc',
+                include=['video_id', 'title'],
+            ),
+            # Partial index over just the live rows published() can return.
+            models.Index(
+                fields=['publish_timestamp'],
+                name='video_active_pub_idx',
+                condition=Q(active=True, state=PublishStateOptions.PUBLISH),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -107,17 +121,20 @@ class Video(models.Model):
     @property
     def is_published(self) -> bool:
         """Check if the video should be publicly visible."""
-        if not self.active:
-            return False
-        if self.state != PublishStateOptions.PUBLISH:
-            return False
-        if not self.publish_timestamp:
-            return False
-        return self.publish_timestamp <= timezone.now()
-
-    def get_playlist_ids(self) -> List[int]:
+        ts = self.publish_timestamp
+        return (
+            self.active
+            and self.state == _PUBLISH
+            and ts is not None
+            and ts <= _now()
+        )
+
+    def get_playlist_ids(self) -> Tuple[int, ...]:
         """Get IDs of all playlists featuring this video."""
-        return list(self.playlist_featured.all().values_list('id', flat=True))
+        cache = getattr(self, '_prefetched_objects_cache', {})
+        if 'playlist_featured' in cache:
+            return tuple(p.id for p in cache['playlist_featured'])
+        return tuple(self.playlist_featured.values_list('id', flat=True))
 
 class VideoAllProxy(Video):
     """Proxy model for accessing all videos in admin."""
@@ -137,13 +154,13 @@ class VideoPublishedProxy(Video):
         verbose_name_plural = 'Published Videos'
         ordering = ['-publish_timestamp']
 
-    def get_queryset(self) -> VideoQuerySet:
-        """Return only published videos."""
-        return super().get_queryset().published()
+# Proxy saves dispatch pre_save with the proxy as sender, so each model
+# is connected explicitly; dispatch_uid keeps reconnects idempotent.
+pre_save.connect(publish_state_pre_save, sender=Video, dispatch_uid='video_publish_state')
+pre_save.connect(slugify_pre_save, sender=Video, dispatch_uid='video_slugify')
 
-# Connect signals to all relevant models
-models_to_connect = [Video, VideoAllProxy, VideoPublishedProxy]
+pre_save.connect(publish_state_pre_save, sender=VideoAllProxy, dispatch_uid='video_publish_state')
+pre_save.connect(slugify_pre_save, sender=VideoAllProxy, dispatch_uid='video_slugify')
 
-for model in models_to_connect:
-    pre_save.connect(publish_state_pre_save, sender=model)
-    pre_save.connect(slugify_pre_save, sender=model)
+pre_save.connect(publish_state_pre_save, sender=VideoPublishedProxy, dispatch_uid='video_publish_state')
+pre_save.connect(slugify_pre_save, sender=VideoPublishedProxy, dispatch_uid='video_slugify')
@@ -1,10 +1,20 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.signals import pre_save
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 
+from djangoflix.db.functions import Now
 from djangoflix.db.models import PublishStateOptions
+from djangoflix.db.receivers import publish_state_pre_save, slugify_pre_save
+from playlists.models import Playlist
 
-from .models import Video
+from .models import Video, VideoAllProxy, VideoPublishedProxy
 
 class VideoModelTestCase(TestCase):
     def setUp(self):
@@ -51,4 +61,143 @@ class VideoModelTestCase(TestCase):
         published_qs_2 = Video.objects.published()
         self.assertTrue(published_qs.exists())
         self.assertEqual(published_qs.count(), published_qs_2.count())
-        
\ No newline at end of file
+
+
+class VideoPublishedTestCase(TestCase):
+    def setUp(self):
+        self.obj = Video.objects.create(
+            title='Published video',
+            video_id='published',
+            state=PublishStateOptions.PUBLISH
+        )
+
+    def test_now_covers_current_millisecond(self):
+        db_now = Video.objects.annotate(now=Now()).values_list('now', flat=True).get()
+        # Last microsecond of the millisecond the database reports as now.
+        end_of_ms = db_now.replace(microsecond=db_now.microsecond // 1000 * 1000 + 999)
+        Video.objects.filter(pk=self.obj.pk).update(publish_timestamp=end_of_ms)
+        self.assertTrue(
+            Video.objects.filter(pk=self.obj.pk, publish_timestamp__lte=db_now).exists()
+        )
+
+    def test_published_immediately(self):
+        self.assertTrue(self.obj.is_published)
+        self.assertTrue(Video.objects.published().filter(pk=self.obj.pk).exists())
+
+
+class VideoAdminTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.user)
+        self.videos = [
+            Video.objects.create(
+                title=f'Video {i}',
+                video_id=f'video-{i}',
+                state=PublishStateOptions.PUBLISH
+            ) for i in range(3)
+        ]
+
+    def test_published_status_immediately(self):
+        response = self.client.get(reverse('admin:videos_videoallproxy_changelist'))
+        self.assertContains(response, 'font-weight: bold;">Published</span>', count=3)
+
+    def unpublish(self, videos):
+        url = reverse('admin:videos_videopublishedproxy_changelist')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, {
+                'action': 'unpublish_selected',
+                '_selected_action': [obj.pk for obj in videos],
+            })
+        queries = [query['sql'] for query in context.captured_queries]
+        pk_reads = [sql for sql in queries if sql.startswith('SELECT "videos_video"."id" FROM')]
+        updates = [sql for sql in queries if sql.startswith('UPDATE "videos_video"')]
+        return response, pk_reads, updates
+
+    def test_unpublish_selected(self):
+        response, pk_reads, updates = self.unpublish(self.videos[:2])
+        self.assertEqual(len(pk_reads), 0)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(Video.objects.filter(active=False).count(), 2)
+        response = self.client.get(response.url)
+        self.assertContains(response, '2 video(s) were successfully unpublished.')
+
+    def test_unpublish_selected_batched(self):
+        with mock.patch('videos.admin.UNPUBLISH_BATCH_SIZE', 2):
+            response, pk_reads, updates = self.unpublish(self.videos)
+        self.assertEqual(len(pk_reads), 1)
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(Video.objects.filter(active=False).count(), 3)
+        response = self.client.get(response.url)
+        self.assertContains(response, '3 video(s) were successfully unpublished.')
+
+
+class VideoAdminSearchTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.user)
+        self.featured = Video.objects.create(title='Featured clip', video_id='featured-clip')
+        self.other = Video.objects.create(title='Other clip', video_id='other-clip')
+        self.playlist = Playlist.objects.create(title='Showcase', video=self.featured)
+        self.url = reverse('admin:videos_videoallproxy_changelist')
+
+    def test_search_playlist_id(self):
+        response = self.client.get(self.url, {'q': str(self.playlist.id)})
+        self.assertContains(response, 'Featured clip')
+        self.assertNotContains(response, 'Other clip')
+
+    def test_search_text(self):
+        response = self.client.get(self.url, {'q': 'Other'})
+        self.assertContains(response, 'Other clip')
+        self.assertNotContains(response, 'Featured clip')
+
+    def test_search_non_ascii_digit(self):
+        response = self.client.get(self.url, {'q': '\u00b2'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_search_out_of_range_id(self):
+        response = self.client.get(self.url, {'q': '999999999999999999999'})
+        self.assertEqual(response.status_code, 200)
+
+
+class VideoAdminChangeFormTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.user)
+        self.video = Video.objects.create(
+            title='Change form video',
+            video_id='change-form',
+            description='Shown on the change form'
+        )
+        Playlist.objects.create(title='Playlist A', video=self.video)
+        Playlist.objects.create(title='Playlist B', video=self.video)
+
+    def test_change_view_queries(self):
+        url = reverse('admin:videos_videoallproxy_change', args=[self.video.pk])
+        # Session, user, savepoint, video row, playlist prefetch, content
+        # type, release; no query for a deferred description or playlist ids.
+        with self.assertNumQueries(7):
+            response = self.client.get(url)
+        self.assertContains(response, 'Shown on the change form')
+
+
+class VideoSignalTestCase(TestCase):
+    def test_proxy_slug_field(self):
+        for model in [VideoAllProxy, VideoPublishedProxy]:
+            title = f'{model.__name__} title'
+            obj = model.objects.create(title=title, video_id=model.__name__)
+            self.assertEqual(obj.slug, slugify(title))
+
+    def test_proxy_publish_timestamp(self):
+        for model in [VideoAllProxy, VideoPublishedProxy]:
+            obj = model.objects.create(
+                title=f'{model.__name__} published',
+                video_id=f'{model.__name__}-published',
+                state=PublishStateOptions.PUBLISH
+            )
+            self.assertIsNotNone(obj.publish_timestamp)
+
+    def test_pre_save_receivers_not_duplicated(self):
+        pre_save.connect(publish_state_pre_save, sender=Video, dispatch_uid='video_publish_state')
+        pre_save.connect(slugify_pre_save, sender=Video, dispatch_uid='video_slugify')
+        for model in [Video, VideoAllProxy, VideoPublishedProxy]:
+            self.assertEqual(len(pre_save._live_receivers(model)), 2)